@@ -0,0 +1 @@
+Add ``JoinResultCache``, a local on-disk cache of per-tile join results with size-bounded LRU eviction, keyed by catalog path and version, join type, radius, column projection and tile.
@@ -1,2 +1,3 @@
 from ._version import __version__
 from .example_module import *
+from .result_cache import JoinCacheKey, JoinResultCache, catalog_identity, catalog_version
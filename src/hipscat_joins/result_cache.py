@@ -0,0 +1,250 @@
+"""On-disk cache of per-tile join results, with size-bounded LRU eviction."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass
+
+CACHE_FILE_SUFFIX = ".pkl"
+TEMP_FILE_SUFFIX = ".tmp"
+STALE_TEMP_SECONDS = 3600
+_MISSING = object()
+
+
+def catalog_version(catalog_path):
+    """Fetch a content version string for the catalog at the given path.
+
+    Uses the modification time and size of the catalog's ``_metadata`` file,
+    falling back to ``catalog_info.json`` for catalogs without parquet metadata.
+    """
+    if not os.path.exists(catalog_path):
+        raise FileNotFoundError(f"No directory exists at {catalog_path}")
+    for metadata_name in ["_metadata", "catalog_info.json"]:
+        metadata_filename = os.path.join(catalog_path, metadata_name)
+        if os.path.exists(metadata_filename):
+            stat = os.stat(metadata_filename)
+            return f"{metadata_name}:{stat.st_mtime_ns}:{stat.st_size}"
+    raise FileNotFoundError(f"No catalog metadata found in {catalog_path}")
+
+
+def catalog_identity(catalog):
+    """Identity of a catalog for cache keys, as (catalog_path, version).
+
+    Args:
+        catalog: an almanac ``CatalogData`` entry, or a path to a catalog directory.
+    """
+    catalog_path = getattr(catalog, "catalog_path", catalog)
+    catalog_path = os.path.abspath(catalog_path)
+    return (catalog_path, catalog_version(catalog_path))
+
+
+@dataclass(frozen=True)
+class JoinCacheKey:
+    """All parameters that determine the result of joining a single tile."""
+
+    left: tuple[str, str]
+    right: tuple[str, str]
+    join_type: str
+    tile: tuple[int, int]
+    radius: float | None = None
+    columns: tuple[str, ...] | None = None
+
+    def __post_init__(self):
+        order, pixel = self.tile
+        object.__setattr__(self, "tile", (int(order), int(pixel)))
+        if self.radius is not None:
+            object.__setattr__(self, "radius", float(self.radius))
+        if self.columns is not None:
+            object.__setattr__(self, "columns", tuple(self.columns))
+
+    def digest(self):
+        """Stable hash of the key, used as the cache file name."""
+        key_text = json.dumps(
+            {
+                "left": list(self.left),
+                "right": list(self.right),
+                "join_type": self.join_type,
+                "tile": list(self.tile),
+                "radius": self.radius,
+                "columns": list(self.columns) if self.columns is not None else None,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(key_text.encode("utf-8")).hexdigest()
+
+
+class JoinResultCache:
+    """Local on-disk cache of join results, stored one file per tile.
+
+    Recency is tracked by file modification time, so several processes
+    (e.g. notebooks) can share a cache directory without a separate index.
+    When the total size exceeds ``max_bytes``, the least recently used
+    tiles are evicted.
+
+    Results are stored with pickle, so loading them can run arbitrary code.
+    The cache directory must be private to the user: it is created with
+    ``0o700`` permissions, and should not be pointed at a shared location.
+    """
+
+    def __init__(self, cache_dir, max_bytes=1024**3):
+        """Create new cache, backed by the given directory"""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+
+    def _file_path(self, key):
+        return os.path.join(self.cache_dir, key.digest() + CACHE_FILE_SUFFIX)
+
+    def get(self, key, default=None):
+        """Fetch the cached result for a key, marking it as recently used."""
+        file_path = self._file_path(key)
+        try:
+            with open(file_path, "rb") as cache_file:
+                result = pickle.load(cache_file)
+        except FileNotFoundError:
+            return default
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            ## Corrupt, or written by an incompatible environment; treat as a miss.
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            return default
+        try:
+            os.utime(file_path)
+        except FileNotFoundError:
+            ## Evicted by another process since loading; the result is still valid.
+            pass
+        return result
+
+    def put(self, key, result, evict=True):
+        """Store the result for a key.
+
+        Unless ``evict`` is False, old entries are then evicted if over the size bound.
+
+        Returns:
+            size in bytes of the stored result.
+        """
+        file_handle, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=TEMP_FILE_SUFFIX)
+        try:
+            with os.fdopen(file_handle, "wb") as cache_file:
+                pickle.dump(result, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+                result_size = cache_file.tell()
+            os.replace(temp_path, self._file_path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        if evict:
+            self.evict()
+        return result_size
+
+    def __contains__(self, key):
+        return os.path.exists(self._file_path(key))
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(CACHE_FILE_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def _remove_stale_temp_files(self):
+        """Remove partial writes left behind by processes killed during ``put``."""
+        cutoff = time.time() - STALE_TEMP_SECONDS
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(TEMP_FILE_SUFFIX):
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def size_bytes(self):
+        """Total size of all cached results."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove least recently used entries until within the size bound.
+
+        Returns:
+            total size in bytes of the remaining cached results.
+        """
+        self._remove_stale_temp_files()
+        entries = sorted(self._entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file_path in entries:
+            if total_size <= self.max_bytes:
+                break
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+        return total_size
+
+    def clear(self):
+        """Remove all cached results."""
+        self._remove_stale_temp_files()
+        for _, _, file_path in self._entries():
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+    def get_or_compute(self, left, right, join_type, tiles, compute_tile, radius=None, columns=None):
+        """Fetch join results for each tile, computing and storing only the missing tiles.
+
+        Args:
+            left: left catalog, as an almanac ``CatalogData`` entry or path.
+            right: right catalog, as an almanac ``CatalogData`` entry or path.
+            join_type (str): kind of join (e.g. "source", "crossmatch").
+            tiles: iterable of (order, pixel) tiles covering the query region.
+            compute_tile: callable taking an (order, pixel) tile and returning its join result.
+            radius (float): crossmatch radius, if applicable.
+            columns: column projection of the result, if any.
+        Returns:
+            dictionary of (order, pixel) tile to join result, in the order of ``tiles``.
+        """
+        left_identity = catalog_identity(left)
+        right_identity = catalog_identity(right)
+
+        results = {}
+        ## Running total of cache size, so the directory is only rescanned once over the bound.
+        total_size = None
+        try:
+            for tile in tiles:
+                key = JoinCacheKey(
+                    left=left_identity,
+                    right=right_identity,
+                    join_type=join_type,
+                    tile=tile,
+                    radius=radius,
+                    columns=columns,
+                )
+                result = self.get(key, _MISSING)
+                if result is _MISSING:
+                    result = compute_tile(key.tile)
+                    result_size = self.put(key, result, evict=False)
+                    if total_size is None:
+                        total_size = self.size_bytes()
+                    else:
+                        total_size += result_size
+                    if total_size > self.max_bytes:
+                        total_size = self.evict()
+                results[key.tile] = result
+        finally:
+            if total_size is not None:
+                self.evict()
+        return results
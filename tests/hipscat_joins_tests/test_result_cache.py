@@ -0,0 +1,251 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from hipscat_joins import result_cache
+from hipscat_joins.result_cache import JoinCacheKey, JoinResultCache, catalog_identity, catalog_version
+
+# pylint: disable=missing-function-docstring, redefined-outer-name
+
+
+@pytest.fixture
+def catalogs(tmp_path):
+    left_path = tmp_path / "object"
+    right_path = tmp_path / "detections"
+    for catalog_path in [left_path, right_path]:
+        catalog_path.mkdir()
+        (catalog_path / "_metadata").write_bytes(b"metadata")
+    return str(left_path), str(right_path)
+
+
+def test_catalog_version(catalogs, tmp_path):
+    left_path, _ = catalogs
+    version = catalog_version(left_path)
+    assert version.startswith("_metadata:")
+
+    with open(os.path.join(left_path, "_metadata"), "ab") as metadata_file:
+        metadata_file.write(b"more")
+    assert catalog_version(left_path) != version
+
+    with pytest.raises(FileNotFoundError, match="No directory"):
+        catalog_version(str(tmp_path / "missing"))
+    with pytest.raises(FileNotFoundError, match="No catalog metadata"):
+        catalog_version(str(tmp_path))
+
+
+def test_put_get(catalogs, tmp_path):
+    cache = JoinResultCache(str(tmp_path / "cache"))
+    left_path, right_path = catalogs
+    key = JoinCacheKey(
+        left=catalog_identity(left_path),
+        right=catalog_identity(right_path),
+        join_type="crossmatch",
+        tile=(1, 44),
+        radius=1.0,
+        columns=("ra", "dec"),
+    )
+    assert key not in cache
+    assert cache.get(key) is None
+
+    cache.put(key, {"ra": [1.0]})
+    assert key in cache
+    assert cache.get(key) == {"ra": [1.0]}
+
+    other_radius = JoinCacheKey(
+        left=key.left, right=key.right, join_type="crossmatch", tile=(1, 44), radius=2.0, columns=key.columns
+    )
+    assert other_radius not in cache
+
+    cache.clear()
+    assert key not in cache
+
+
+def test_get_or_compute_reuses_tiles(catalogs, tmp_path):
+    cache = JoinResultCache(str(tmp_path / "cache"))
+    left_path, right_path = catalogs
+    computed = []
+
+    def compute_tile(tile):
+        computed.append(tile)
+        return f"result {tile}"
+
+    results = cache.get_or_compute(left_path, right_path, "source", [(1, 44), (1, 45)], compute_tile)
+    assert results == {(1, 44): "result (1, 44)", (1, 45): "result (1, 45)"}
+    assert computed == [(1, 44), (1, 45)]
+
+    ## Partial overlap only computes the new tile.
+    results = cache.get_or_compute(left_path, right_path, "source", [(1, 45), (1, 46)], compute_tile)
+    assert list(results) == [(1, 45), (1, 46)]
+    assert computed == [(1, 44), (1, 45), (1, 46)]
+
+    ## New catalog version invalidates previous results.
+    with open(os.path.join(right_path, "_metadata"), "ab") as metadata_file:
+        metadata_file.write(b"more")
+    cache.get_or_compute(left_path, right_path, "source", [(1, 44)], compute_tile)
+    assert computed == [(1, 44), (1, 45), (1, 46), (1, 44)]
+
+
+def test_lru_eviction(catalogs, tmp_path):
+    left_path, right_path = catalogs
+    payload = b"x" * 1000
+    cache = JoinResultCache(str(tmp_path / "cache"), max_bytes=2500)
+    keys = [
+        JoinCacheKey(
+            left=catalog_identity(left_path),
+            right=catalog_identity(right_path),
+            join_type="source",
+            tile=(1, pixel),
+        )
+        for pixel in range(3)
+    ]
+    cache.put(keys[0], payload)
+    cache.put(keys[1], payload)
+    ## Force distinct recency, then touch the first key so the second is least recent.
+    os.utime(cache._file_path(keys[0]), ns=(1, 1))  # pylint: disable=protected-access
+    os.utime(cache._file_path(keys[1]), ns=(2, 2))  # pylint: disable=protected-access
+    assert cache.get(keys[0]) == payload
+
+    cache.put(keys[2], payload)
+    assert keys[0] in cache
+    assert keys[1] not in cache
+    assert keys[2] in cache
+    assert cache.size_bytes() <= 2500
+
+
+def test_key_normalized(catalogs):
+    left_path, right_path = catalogs
+    left, right = catalog_identity(left_path), catalog_identity(right_path)
+    int_key = JoinCacheKey(left=left, right=right, join_type="crossmatch", tile=(1, 44), radius=1)
+    float_key = JoinCacheKey(
+        left=left, right=right, join_type="crossmatch", tile=(np.int64(1), np.uint64(44)), radius=1.0
+    )
+    assert int_key == float_key
+    assert int_key.digest() == float_key.digest()
+    assert float_key.tile == (1, 44)
+    assert isinstance(float_key.tile[0], int)
+
+
+def _remove_and_return(file_path, value):
+    os.remove(file_path)
+    return value
+
+
+class RemovedOnLoad:
+    """Result that deletes its own cache file while being unpickled."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def __reduce__(self):
+        return (_remove_and_return, (self.file_path, "result"))
+
+
+def test_get_file_removed_after_load(catalogs, tmp_path):
+    cache = JoinResultCache(str(tmp_path / "cache"))
+    left_path, right_path = catalogs
+    key = JoinCacheKey(
+        left=catalog_identity(left_path), right=catalog_identity(right_path), join_type="source", tile=(1, 44)
+    )
+    cache.put(key, RemovedOnLoad(cache._file_path(key)))  # pylint: disable=protected-access
+    assert cache.get(key) == "result"
+    assert key not in cache
+
+
+def test_get_corrupt_entry(catalogs, tmp_path):
+    cache = JoinResultCache(str(tmp_path / "cache"))
+    left_path, right_path = catalogs
+    key = JoinCacheKey(
+        left=catalog_identity(left_path), right=catalog_identity(right_path), join_type="source", tile=(1, 44)
+    )
+    cache.put(key, "result")
+    with open(cache._file_path(key), "wb") as cache_file:  # pylint: disable=protected-access
+        cache_file.write(b"not a pickle")
+
+    assert cache.get(key) is None
+    assert key not in cache
+
+    results = cache.get_or_compute(left_path, right_path, "source", [(1, 44)], lambda tile: "recomputed")
+    assert results == {(1, 44): "recomputed"}
+
+
+def test_entries_removed_during_scan(catalogs, tmp_path, monkeypatch):
+    cache = JoinResultCache(str(tmp_path / "cache"))
+    left_path, right_path = catalogs
+    cache.get_or_compute(left_path, right_path, "source", [(1, 44), (1, 45)], str)
+    original_scandir = os.scandir
+
+    def scandir_then_remove(path):
+        ## Another process deletes each file after it was listed, but before it is stat-ed.
+        for entry in original_scandir(path):
+            os.remove(entry.path)
+            yield entry
+
+    monkeypatch.setattr(os, "scandir", scandir_then_remove)
+    assert cache.size_bytes() == 0
+    cache.clear()
+
+
+def test_get_or_compute_evicts_once(catalogs, tmp_path, monkeypatch):
+    cache = JoinResultCache(str(tmp_path / "cache"))
+    left_path, right_path = catalogs
+    evict_calls = []
+    original_evict = cache.evict
+
+    def counting_evict():
+        evict_calls.append(True)
+        original_evict()
+
+    monkeypatch.setattr(cache, "evict", counting_evict)
+    tiles = [(1, pixel) for pixel in range(5)]
+    cache.get_or_compute(left_path, right_path, "source", tiles, str)
+    ## Within the size bound, so only the final eviction.
+    assert len(evict_calls) == 1
+
+    ## Everything cached, so nothing stored and nothing to evict.
+    cache.get_or_compute(left_path, right_path, "source", tiles, str)
+    assert len(evict_calls) == 1
+
+
+def test_get_or_compute_stays_bounded(catalogs, tmp_path):
+    left_path, right_path = catalogs
+    cache = JoinResultCache(str(tmp_path / "cache"), max_bytes=2500)
+    payload = b"x" * 1000
+
+    def compute_tile(tile):
+        ## At most one freshly written result over the bound at any time.
+        assert cache.size_bytes() <= cache.max_bytes + 1100
+        if tile[1] == 8:
+            raise ValueError("failed tile")
+        return payload
+
+    with pytest.raises(ValueError, match="failed tile"):
+        cache.get_or_compute(left_path, right_path, "source", [(1, pixel) for pixel in range(10)], compute_tile)
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_cache_dir_private(tmp_path):
+    cache_dir = tmp_path / "cache"
+    JoinResultCache(str(cache_dir))
+    assert cache_dir.stat().st_mode & 0o077 == 0
+
+
+def test_stale_temp_files_removed(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = JoinResultCache(str(cache_dir))
+    stale_file = cache_dir / "stale.tmp"
+    fresh_file = cache_dir / "fresh.tmp"
+    stale_file.write_bytes(b"partial")
+    fresh_file.write_bytes(b"partial")
+    stale_time = time.time() - result_cache.STALE_TEMP_SECONDS - 10
+    os.utime(stale_file, (stale_time, stale_time))
+
+    cache.evict()
+    assert not stale_file.exists()
+    assert fresh_file.exists()
+
+
+def test_invalid_size(tmp_path):
+    with pytest.raises(ValueError, match="max_bytes"):
+        JoinResultCache(str(tmp_path), max_bytes=0)